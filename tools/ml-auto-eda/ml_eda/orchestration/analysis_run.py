@@ -51,8 +51,7 @@ class Run:
     self.report_path = self._config_params.report_path
     self.figure_path = os.path.join(os.path.dirname(self.report_path),
                                     'figure')
-    if not os.path.exists(self.figure_path):
-      os.makedirs(self.figure_path)
+    os.makedirs(self.figure_path, exist_ok=True)
 
     logging.info(self._metadata_def.datasource)
 
@@ -57,6 +57,8 @@ class AttributeAnalysisTracker:
     self.att_type = att_type
     self.att_name = att_name
     self.attribute_tracker = dict()
+    # index of {analysis_name: {analysis_unique_name: analysis}}
+    self.analysis_name_tracker = defaultdict(dict)
 
   def add_analysis(self, analysis: run_metadata_pb2.Analysis):
     """Add an analysis result to attribute tracker
@@ -68,7 +70,9 @@ class AttributeAnalysisTracker:
 
     """
     analysis_unique_name = get_analysis_unique_name(analysis)
+    analysis_name = run_metadata_pb2.Analysis.Name.Name(analysis.name)
     self.attribute_tracker[analysis_unique_name] = analysis
+    self.analysis_name_tracker[analysis_name][analysis_unique_name] = analysis
 
   def get_analysis(self,
                    analysis_name: str) -> List[run_metadata_pb2.Analysis]:
@@ -82,12 +86,7 @@ class AttributeAnalysisTracker:
     Returns:
         List[run_metadata_pb2.Analysis]
     """
-
-    analysis = []
-    for item in self.attribute_tracker:
-      if item.startswith(analysis_name):
-        analysis.append(self.attribute_tracker[item])
-    return analysis
+    return list(self.analysis_name_tracker.get(analysis_name, {}).values())
 
   def get_all_analysis(self) -> List[run_metadata_pb2.Analysis]:
     """Return all the analysis stored in the attribute tracker"""
@@ -107,6 +106,8 @@ class AnalysisTracker:
     self.attribute_tracker = dict()
     # tracker for attributes in different type
     self.attribute_type_tracker = defaultdict(set)
+    # tracker for analysis grouped by analysis name
+    self.analysis_name_tracker = defaultdict(dict)
 
   def add_analysis(self, analysis: run_metadata_pb2.Analysis):
     """Add analysis to two trackers
@@ -120,9 +121,11 @@ class AnalysisTracker:
     analysis_attributes = analysis.features
     # Get the unique name for the analysis
     analysis_unique_name = get_analysis_unique_name(analysis)
+    analysis_name = run_metadata_pb2.Analysis.Name.Name(analysis.name)
 
     # Add analysis to analysis_tracker
     self.analysis_tracker[analysis_unique_name] = analysis
+    self.analysis_name_tracker[analysis_name][analysis_unique_name] = analysis
 
     # Add analysis to attribute_tracker
     for attr in analysis_attributes:
@@ -180,8 +183,4 @@ class AnalysisTracker:
   def get_analysis(self, analysis_name: str
                    ) -> List[run_metadata_pb2.Analysis]:
     """Get all the analyses given analysis name"""
-    analysis = []
-    for item in self.analysis_tracker:
-      if item.startswith(analysis_name):
-        analysis.append(self.analysis_tracker[item])
-    return analysis
+    return list(self.analysis_name_tracker.get(analysis_name, {}).values())
@@ -20,6 +20,7 @@ from typing import Union
 
 from ml_eda.metadata import run_metadata_pb2
 from ml_eda.reporting import template
+from ml_eda.reporting import utils
 
 # Thresholds
 MISSING_THRESHOLD = 0.1
@@ -106,7 +107,7 @@ def check_pearson_correlation(analysis: run_metadata_pb2.Analysis
     Union[None, string]
   """
   metrics = analysis.smetrics
-  name_list = [att.name for att in analysis.features]
+  name_one, name_two = (att.name for att in analysis.features)
   coefficient = 0
 
   for item in metrics:
@@ -115,8 +116,8 @@ def check_pearson_correlation(analysis: run_metadata_pb2.Analysis
 
   if abs(coefficient) > CORRELATION_COEFFICIENT_THRESHOLD:
     return template.HIGH_CORRELATION.format(
-        name_one=name_list[0],
-        name_two=name_list[1],
+        name_one=name_one,
+        name_two=name_two,
         metric='correlation coefficient',
         value="{0:.2f}".format(coefficient)
     )
@@ -137,14 +138,14 @@ def check_p_value(analysis: run_metadata_pb2.Analysis
     Union[None, string]
   """
   metric = analysis.smetrics[0]
-  analysis_name = run_metadata_pb2.Analysis.Name.Name(analysis.name)
-  name_list = [att.name for att in analysis.features]
+  analysis_name = utils.ANALYSIS_NAMES[analysis.name]
+  name_one, name_two = (att.name for att in analysis.features)
   p_value = metric.value
 
   if p_value < P_VALUE_THRESHOLD:
     return template.LOW_P_VALUE.format(
-        name_one=name_list[0],
-        name_two=name_list[1],
+        name_one=name_one,
+        name_two=name_two,
         metric='p-value',
         value="{:.2E}".format(Decimal(str(p_value))),
         test_name=analysis_name
@@ -64,7 +64,7 @@ REPORT_STRUCTURE = (
 
 def create_descriptive_section(
     analysis_tracker: AnalysisTracker,
-    figure_base_path: str) -> (str, List[str]):
+    figure_base_path: str) -> Union[Tuple[str, List[str]], None]:
   """Create descriptive section of the report
 
   Args:
@@ -72,7 +72,7 @@ def create_descriptive_section(
       figure_base_path: (string), the folder for holding figures
 
   Returns:
-      (str, List[str]), (section_content, List[warnings])
+      Union[Tuple[str, List[str]], None], (section_content, List[warnings])
   """
 
   numerical_attributes = analysis_tracker.get_numerical_attributes()
@@ -84,51 +84,52 @@ def create_descriptive_section(
 
   section_template = template.TABLE_DESCRIPTIVE_TEMPLATE
 
-  for att in numerical_attributes:
-    # base analysis is one holding basic descriptive statistics
-    base_analysis = analysis_tracker.get_attribute_analysis(
-        att, run_metadata_pb2.Analysis.Name.Name(
-            run_metadata_pb2.Analysis.DESCRIPTIVE))[0]
-    # additional analysis is one holding histogram for numerical attribute
-    additional_analysis = analysis_tracker.get_attribute_analysis(
-        att, run_metadata_pb2.Analysis.Name.Name(
-            run_metadata_pb2.Analysis.HISTOGRAM))[0]
-    contents.append(utils.create_table_descriptive_row_from_analysis(
-        attribute_name=att,
-        base_analysis=base_analysis,
-        additional_analysis=additional_analysis,
-        figure_base_path=figure_base_path
-    ))
-    # check missing value condition
-    missing_check = recommendation.check_missing(att, base_analysis)
-    if missing_check:
-      warnings.append(missing_check)
+  descriptive_name = utils.ANALYSIS_NAMES[
+      run_metadata_pb2.Analysis.DESCRIPTIVE]
+  # additional analysis is one holding histogram for numerical attribute
+  # and value counts for categorical attribute
+  additional_names = {
+      run_metadata_pb2.Attribute.NUMERICAL:
+          utils.ANALYSIS_NAMES[run_metadata_pb2.Analysis.HISTOGRAM],
+      run_metadata_pb2.Attribute.CATEGORICAL:
+          utils.ANALYSIS_NAMES[run_metadata_pb2.Analysis.VALUE_COUNTS]
+  }
+
+  attributes = (
+      [(att, run_metadata_pb2.Attribute.NUMERICAL)
+       for att in numerical_attributes] +
+      [(att, run_metadata_pb2.Attribute.CATEGORICAL)
+       for att in categorical_attributes])
 
-  for att in categorical_attributes:
+  for att, att_type in attributes:
     # base analysis is one holding basic descriptive statistics
     base_analysis = analysis_tracker.get_attribute_analysis(
-        att, run_metadata_pb2.Analysis.Name.Name(
-            run_metadata_pb2.Analysis.DESCRIPTIVE))[0]
-    # additional analysis is one holding value counts
-    # for categorical attribute
+        att, descriptive_name)
     additional_analysis = analysis_tracker.get_attribute_analysis(
-        att, run_metadata_pb2.Analysis.Name.Name(
-            run_metadata_pb2.Analysis.VALUE_COUNTS))[0]
+        att, additional_names[att_type])
+    # skip the attribute if either analysis was not performed
+    if not base_analysis or not additional_analysis:
+      continue
+    base_analysis = base_analysis[0]
     contents.append(utils.create_table_descriptive_row_from_analysis(
         attribute_name=att,
         base_analysis=base_analysis,
-        additional_analysis=additional_analysis,
+        additional_analysis=additional_analysis[0],
         figure_base_path=figure_base_path
-
     ))
     # check missing value condition
     missing_check = recommendation.check_missing(att, base_analysis)
     if missing_check:
       warnings.append(missing_check)
-    # check cardinality condition
-    cardinality_check = recommendation.check_cardinality(att, base_analysis)
-    if cardinality_check:
-      warnings.append(cardinality_check)
+    # check cardinality condition for categorical attribute
+    if att_type == run_metadata_pb2.Attribute.CATEGORICAL:
+      cardinality_check = recommendation.check_cardinality(att,
+                                                           base_analysis)
+      if cardinality_check:
+        warnings.append(cardinality_check)
+
+  if not contents:
+    return None
 
   table_content = section_template.format(row_content=''.join(contents))
 
@@ -155,8 +156,7 @@ def create_pearson_correlation_section(
   # extract the correlation analysis result
   # each pair of numerical attributes will have one corresponding analysis
   corr_analysis = analysis_tracker.get_analysis(
-      run_metadata_pb2.Analysis.Name.Name(
-          run_metadata_pb2.Analysis.PEARSON_CORRELATION))
+      utils.ANALYSIS_NAMES[run_metadata_pb2.Analysis.PEARSON_CORRELATION])
 
   if corr_analysis:
 
@@ -196,8 +196,7 @@ def create_information_gain_section(
   # extract the information gain analysis result
   # each pair of categorical attributes will have one corresponding analysis
   info_analysis = analysis_tracker.get_analysis(
-      run_metadata_pb2.Analysis.Name.Name(
-          run_metadata_pb2.Analysis.INFORMATION_GAIN))
+      utils.ANALYSIS_NAMES[run_metadata_pb2.Analysis.INFORMATION_GAIN])
 
   if info_analysis:
     return utils.create_no_order_pair_metric_section(
@@ -225,8 +224,7 @@ def create_anova_section(analysis_tracker: AnalysisTracker
   # each pair of numerical and categorical attributes will have
   # one corresponding analysis
   anova_analysis = analysis_tracker.get_analysis(
-      run_metadata_pb2.Analysis.Name.Name(
-          run_metadata_pb2.Analysis.ANOVA))
+      utils.ANALYSIS_NAMES[run_metadata_pb2.Analysis.ANOVA])
 
   if anova_analysis:
     table_content = utils.create_order_pair_metric_section(
@@ -261,8 +259,7 @@ def create_chi_square_section(analysis_tracker: AnalysisTracker
   # each pair of categorical attributes will have
   # one corresponding analysis
   chi_square_analysis = analysis_tracker.get_analysis(
-      run_metadata_pb2.Analysis.Name.Name(
-          run_metadata_pb2.Analysis.CHI_SQUARE))
+      utils.ANALYSIS_NAMES[run_metadata_pb2.Analysis.CHI_SQUARE])
 
   if chi_square_analysis:
     table_content = utils.create_no_order_pair_metric_section(
@@ -295,15 +292,14 @@ def create_contingency_table_section(analysis_tracker: AnalysisTracker
   # extract the contingency table analysis result
   # each pair of categorical attributes will have one corresponding analysis
   analysis_results = analysis_tracker.get_analysis(
-      run_metadata_pb2.Analysis.Name.Name(
-          run_metadata_pb2.Analysis.CONTINGENCY_TABLE))
+      utils.ANALYSIS_NAMES[run_metadata_pb2.Analysis.CONTINGENCY_TABLE])
 
   if analysis_results:
     content = []
     for analysis in analysis_results:
-      attributes = [item.name for item in analysis.features]
+      name_one, name_two = (item.name for item in analysis.features)
       section_title = template.SUB_SUB_SUB_SECTION_TITLE.format(
-          content="{} / {}".format(attributes[0], attributes[1]))
+          content="{} / {}".format(name_one, name_two))
       analysis_content_str = utils.create_table_from_TableMetric(
           analysis.tmetrics[0])
       content.extend([section_title, analysis_content_str, "\n<br/>\n"])
@@ -325,15 +321,15 @@ def create_table_descriptive_section(analysis_tracker: AnalysisTracker
   # extract the descriptive table analysis result
   # each pair of categorical attributes will have one corresponding analysis
   analysis_results = analysis_tracker.get_analysis(
-      run_metadata_pb2.Analysis.Name.Name(
-          run_metadata_pb2.Analysis.TABLE_DESCRIPTIVE))
+      utils.ANALYSIS_NAMES[run_metadata_pb2.Analysis.TABLE_DESCRIPTIVE])
 
   if analysis_results:
     content = []
     for analysis in analysis_results:
-      attributes = [item.name for item in analysis.features][::-1]
+      # the attributes are displayed in the reverse order
+      name_one, name_two = (item.name for item in analysis.features)
       section_title = template.SUB_SUB_SUB_SECTION_TITLE.format(
-          content="{} / {}".format(attributes[0], attributes[1]))
+          content="{} / {}".format(name_two, name_one))
       analysis_content_str = utils.create_table_from_TableMetric(
           analysis.tmetrics[0])
       content.extend([section_title, analysis_content_str, "\n<br/>\n"])
@@ -424,22 +420,19 @@ def create_target_highlight_section(analysis_tracker: AnalysisTracker
     if ml_problem == c.metadata.ml_type.REGRESSION:
       # Correlation for numerical attributes
       # ANOVA for categorical attributes
-      numerical_metric_names = [run_metadata_pb2.Analysis.Name.Name(
-          run_metadata_pb2.Analysis.PEARSON_CORRELATION)]
+      numerical_metric_names = [
+          utils.ANALYSIS_NAMES[run_metadata_pb2.Analysis.PEARSON_CORRELATION]]
       categorical_metric_names = [
-          run_metadata_pb2.Analysis.Name.Name(
-              run_metadata_pb2.Analysis.ANOVA)]
+          utils.ANALYSIS_NAMES[run_metadata_pb2.Analysis.ANOVA]]
 
     elif ml_problem == c.metadata.ml_type.CLASSIFICATION:
       # ANOVA for numerical attributes
       # IG and Chi-square for categorical attributes
-      numerical_metric_names = [run_metadata_pb2.Analysis.Name.Name(
-          run_metadata_pb2.Analysis.ANOVA)]
+      numerical_metric_names = [
+          utils.ANALYSIS_NAMES[run_metadata_pb2.Analysis.ANOVA]]
       categorical_metric_names = [
-          run_metadata_pb2.Analysis.Name.Name(
-              run_metadata_pb2.Analysis.INFORMATION_GAIN),
-          run_metadata_pb2.Analysis.Name.Name(
-              run_metadata_pb2.Analysis.CHI_SQUARE)]
+          utils.ANALYSIS_NAMES[run_metadata_pb2.Analysis.INFORMATION_GAIN],
+          utils.ANALYSIS_NAMES[run_metadata_pb2.Analysis.CHI_SQUARE]]
 
     else:
       raise ValueError('The ML problem type is not supported')
@@ -507,12 +500,14 @@ def create_report_contents(analysis_tracker: AnalysisTracker,
       create_dataset_info_section(analysis_tracker))
 
   # Descriptive Analysis section
-  descriptive_content, descriptive_warning = create_descriptive_section(
+  descriptive_result = create_descriptive_section(
       analysis_tracker=analysis_tracker,
       figure_base_path=figure_base_path)
-  report_content['descriptive'].append(descriptive_content)
-  if descriptive_warning:
-    report_content['warning'].extend(descriptive_warning)
+  if descriptive_result is not None:
+    descriptive_content, descriptive_warning = descriptive_result
+    report_content['descriptive'].append(descriptive_content)
+    if descriptive_warning:
+      report_content['warning'].extend(descriptive_warning)
 
   # Correlation Analysis
   # Pearson correlation
@@ -18,15 +18,29 @@
 from __future__ import absolute_import
 from __future__ import print_function
 
-from collections import OrderedDict
-from typing import Set, Dict, List, Union
+from typing import List, Union
 from decimal import Decimal
 
+import numpy as np
+
 from ml_eda.reporting import template
 from ml_eda.metadata import run_metadata_pb2
 from ml_eda.constants import COMMON_ORDER, NUMERICAL_ORDER, CATEGORICAL_ORDER
 from ml_eda.reporting import visualization
 
+# Enum value -> name mappings, computed once instead of going through
+# the protobuf enum descriptor for every metric
+ANALYSIS_NAMES = {
+    item.number: item.name
+    for item in run_metadata_pb2.Analysis.Name.DESCRIPTOR.values}
+SCALAR_METRIC_NAMES = {
+    item.number: item.name
+    for item in run_metadata_pb2.ScalarMetric.Name.DESCRIPTOR.values}
+
+# Display order of the descriptive metrics, consistent for every attribute
+NUMERICAL_DISPLAY_ORDER = COMMON_ORDER + NUMERICAL_ORDER
+CATEGORICAL_DISPLAY_ORDER = COMMON_ORDER + CATEGORICAL_ORDER
+
 
 def create_table_descriptive_row_from_analysis(
     attribute_name: str,
@@ -54,27 +68,17 @@ def create_table_descriptive_row_from_analysis(
   metrics = base_analysis.smetrics
   attribute_type = base_analysis.features[0].type
 
-  # Make sure the display order of each attribute is consistent
-  common_order = COMMON_ORDER
   if attribute_type == run_metadata_pb2.Attribute.NUMERICAL:
-    detail_order = NUMERICAL_ORDER
+    display_order = NUMERICAL_DISPLAY_ORDER
   else:
-    detail_order = CATEGORICAL_ORDER
-  # Use a OrderedDict to store the result
-  result_holder = OrderedDict(
-      [(item, 0) for item in common_order + detail_order])
-  for item in metrics:
-    name = run_metadata_pb2.ScalarMetric.Name.Name(item.name)
-    value = "{0:.2f}".format(item.value)
-    result_holder[name] = value
-
-  # Construct the markdown formated row
-  row_stats_contents = []
-  for item in result_holder:
-    row_stats_contents.append(stats_template.format(
-        metric=item,
-        value=result_holder[item]
-    ))
+    display_order = CATEGORICAL_DISPLAY_ORDER
+  metric_values = {SCALAR_METRIC_NAMES[item.name]: "{0:.2f}".format(item.value)
+                   for item in metrics}
+
+  # Construct the markdown formated row, missing metrics are shown as 0
+  row_stats_contents = [
+      stats_template.format(metric=name, value=metric_values.get(name, 0))
+      for name in display_order]
 
   figure_path = visualization.plot_bar_chart(additional_analysis,
                                              figure_base_path)
@@ -136,10 +140,9 @@ def create_table_from_TableMetric(
   )
 
 
-def create_pairwise_metric_table(row_list: Set[str],
-                                 column_list: Set[str],
-                                 name_value_map: Dict[str, float],
-                                 same_match_value) -> str:
+def create_pairwise_metric_table(row_list: List[str],
+                                 column_list: List[str],
+                                 metric_matrix: np.ndarray) -> str:
   """Construct table for pair-wise computed metrics, e.g.,
   PEARSON_CORRELATION, ANOVA, CHI_SQUARE, INFORMATION_GAIN
 
@@ -151,12 +154,11 @@ def create_pairwise_metric_table(row_list: Set[str],
   trip_total|0.1952170878648758|0.22858665883541107|1
 
   Args:
-      row_list: (List[str]), list of attribute names for table header
-      column_list: (List[str]), list of attribute names for table row name
-      name_value_map: (Dict[str, float]), map of name -> value
-      same_match_value: value if the column and row name are the same. This
-      could be either float or 'NA' depends on whether the computation of
-      A-v.s.-A makes sense
+      row_list: (List[str]), list of attribute names for table row name
+      column_list: (List[str]), list of attribute names for table header
+      metric_matrix: (np.ndarray), matrix of metric values in the order of
+      row_list and column_list. A cell could be either float or string,
+      e.g., 'NA' if the computation of A-v.s.-A doesn't make sense
 
   Returns:
       string
@@ -169,19 +171,13 @@ def create_pairwise_metric_table(row_list: Set[str],
 
   table_content = []
 
-  for row_name in row_list:
+  for row_name, matrix_row in zip(row_list, metric_matrix):
     # row header is in BOLD
     row_values = [template.BOLD.format(content=row_name.strip())]
-    for col_name in column_list:
-      # same_match_value is used when row_name == column_name
-      if row_name == col_name:
-        value = same_match_value
-      else:
-        value = name_value_map[row_name + '-' + col_name]
-
-      # if the same_match_value is string, simply append it
+    for value in matrix_row:
+      # if the value is string, e.g., 'NA', simply append it
       if isinstance(value, str):
-        row_values.append(same_match_value)
+        row_values.append(value)
       else:
         row_values.append("{:.2E}".format(Decimal(str(value))))
 
@@ -212,29 +208,37 @@ def create_no_order_pair_metric_section(
   Returns:
       string
   """
-  attribute_list = set()
-  # a dictionary with {attributeone-attributetwo: metric_value}
-  analysis_name_value_map = {}
+  # Sorted to keep the table layout stable between runs
+  attribute_list = sorted({att.name for item in analysis_list
+                           for att in item.features})
+  attribute_index = {name: i for i, name in enumerate(attribute_list)}
+
+  rows, cols, values = [], [], []
   for item in analysis_list:
-    value = item.smetrics[0].value
-    name_list = [att.name for att in item.features]
-    attribute_list.update(name_list)
-    analysis_name_value_map['-'.join(name_list)] = value
-    analysis_name_value_map['-'.join(reversed(name_list))] = value
+    row_name, col_name = (att.name for att in item.features)
+    rows.append(attribute_index[row_name])
+    cols.append(attribute_index[col_name])
+    values.append(item.smetrics[0].value)
+
+  # The metric is symmetric, every analysis fills two cells of the matrix.
+  # Cells with the same row and column keep the same_match_value, which
+  # could be a string, hence the object dtype.
+  metric_matrix = np.full((len(attribute_list), len(attribute_list)),
+                          same_match_value, dtype=object)
+  metric_matrix[rows, cols] = values
+  metric_matrix[cols, rows] = values
 
   table_content = create_pairwise_metric_table(
       row_list=attribute_list,
       column_list=attribute_list,
-      name_value_map=analysis_name_value_map,
-      same_match_value=same_match_value)
+      metric_matrix=metric_matrix)
 
   if table_name != "NA":
     figure_path = visualization.plot_heat_map_for_metric_table(
         heat_map_name=table_name,
         row_list=attribute_list,
         column_list=attribute_list,
-        name_value_map=analysis_name_value_map,
-        same_match_value=same_match_value,
+        metric_matrix=metric_matrix,
         figure_base_path=figure_base_path)
     figure_content = template.IMAGE_TEMPLATE.format(
         url=figure_path,
@@ -258,21 +262,29 @@ def create_order_pair_metric_section(
   Returns:
       string
   """
-  row_list = set()
-  column_list = set()
-  # a dictionary with {attributeone-attributetwo: metric_value}
-  analysis_name_value_map = {}
+  # The first attribute of an analysis is the row, the second the column
+  row_list = sorted({item.features[0].name for item in analysis_list})
+  column_list = sorted({item.features[1].name for item in analysis_list})
+  row_index = {name: i for i, name in enumerate(row_list)}
+  column_index = {name: i for i, name in enumerate(column_list)}
+
+  rows, cols, values = [], [], []
   for item in analysis_list:
-    value = item.smetrics[0].value
-    name_list = [att.name for att in item.features]
-    row_list.add(name_list[0])
-    column_list.add(name_list[1])
-    analysis_name_value_map['-'.join(name_list)] = value
+    row_name, col_name = (att.name for att in item.features)
+    rows.append(row_index[row_name])
+    cols.append(column_index[col_name])
+    values.append(item.smetrics[0].value)
+
+  # Only the cell matching the order of the analysis is filled, the others
+  # keep the same_match_value
+  metric_matrix = np.full((len(row_list), len(column_list)),
+                          same_match_value, dtype=object)
+  metric_matrix[rows, cols] = values
+
   return create_pairwise_metric_table(
       row_list=row_list,
       column_list=column_list,
-      name_value_map=analysis_name_value_map,
-      same_match_value=same_match_value)
+      metric_matrix=metric_matrix)
 
 
 def create_target_metrics_highlight(
@@ -318,7 +330,7 @@ def create_target_metrics_highlight(
   metric_holders = {metric: {} for metric in metric_name_list}
   for i in range(num_metrics):
     for analysis in metric_analysis_list[i]:
-      metric_name = run_metadata_pb2.Analysis.Name.Name(analysis.name)
+      metric_name = ANALYSIS_NAMES[analysis.name]
       attribute_name = [att.name for att in analysis.features
                         if att.name != target_name][0]
       attribute_set.add(attribute_name)
@@ -17,8 +17,9 @@
 # pylint: disable-msg=wrong-import-position
 import re
 import os
-from typing import Set, Dict, List
+from typing import List
 
+import numpy as np
 import pandas as pd
 import matplotlib
 
@@ -37,6 +38,24 @@ def _trim_xlabel(xlabels: List[str]) -> List[str]:
           for item in xlabels]
 
 
+def _save_figure(figure, figure_name: str, figure_base_path: str) -> str:
+  """Save the figure under the figure folder and release it
+
+  Args:
+      figure: (matplotlib.figure.Figure), the figure to be saved
+      figure_name: (string), file name of the figure, including extension
+      figure_base_path: (string), the folder for holding figures
+
+  Returns:
+      string, path of the saved figure
+  """
+  output_path = os.path.join(figure_base_path, figure_name)
+  figure.savefig(output_path, dpi=(200))
+  # Figures are kept alive by pyplot until closed explicitly
+  plt.close(figure)
+  return output_path
+
+
 def plot_bar_chart(
     analysis: run_metadata_pb2.Analysis,
     figure_base_path: str) -> str:
@@ -82,73 +101,56 @@ def plot_bar_chart(
   # Trim the xlabel to make it look nicer
   columns = _trim_xlabel(columns)
 
-  for row in table_metric.rows:
-    row_values = [item.value for item in row.cells]
-
-  df = pd.DataFrame({'bin_name': columns, "Frequency": row_values})
+  # The frequencies are held by the single row of the table
+  row_values = [item.value for item in table_metric.rows[-1].cells]
 
   fig, axs = plt.subplots(figsize=FIGURE_SIZE)
   fig.subplots_adjust(bottom=0.2)
 
-  df.plot.bar(x="bin_name", y="Frequency", ax=axs, width=0.8)
+  # Plot the values directly, same layout as pandas' DataFrame.plot.bar
+  positions = range(len(columns))
+  axs.bar(positions, row_values, width=0.8, label="Frequency")
+  axs.set_xticks(positions)
+  axs.set_xticklabels(columns, rotation=90)
+  axs.legend()
   axs.set_xlabel(attribute_name)
   axs.set_ylabel('Number of records')
   axs.grid(True, which='both')
 
-  output_path = os.path.join(
-      figure_base_path, '{}_histogram.png'.format(attribute_name))
-  plt.savefig(output_path, dpi=(200))
-
-  return output_path
+  return _save_figure(fig, '{}_histogram.png'.format(attribute_name),
+                      figure_base_path)
 
 
 def plot_heat_map_for_metric_table(
     heat_map_name: str,
-    row_list: Set[str],
-    column_list: Set[str],
-    name_value_map: Dict[str, float],
-    same_match_value: float,
+    row_list: List[str],
+    column_list: List[str],
+    metric_matrix: np.ndarray,
     figure_base_path: str) -> str:
   """Creat heat map for pair-wised analysis. Currently, this is done for
   numerical pearson correlation and categorical information gain.
 
   Args:
       heat_map_name: (string), name of the heat map
-      row_list: (Set[str]), row index
-      column_list: (Set[str]), column index
-      name_value_map: (Dict[str, float]), dictionary storing the value of the
-      analysis with key being att1-att2, i.e., {att1-att2: value}
-      same_match_value: (float), value to fill the cell with row and column
-      index being the same
+      row_list: (List[str]), row index
+      column_list: (List[str]), column index
+      metric_matrix: (np.ndarray), matrix of metric values in the order of
+      row_list and column_list
       figure_base_path: (string), the folder for holding figures
 
   Returns:
       string, path of the generated figure
   """
-  table_content = []
-
-  for row_name in row_list:
-    row_values = []
-    for col_name in column_list:
-      if row_name == col_name:
-        value = same_match_value
-      else:
-        value = name_value_map[row_name + '-' + col_name]
-      row_values.append(value)
-    table_content.append(row_values)
-
   # Construct the typical corr DataFrame
-  corr = pd.DataFrame(data=table_content, index=row_list, columns=column_list)
+  corr = pd.DataFrame(data=metric_matrix, index=row_list,
+                      columns=column_list, dtype=float)
 
   # plot the heatmap
-  _, axs = plt.subplots(figsize=FIGURE_SIZE)
+  fig, axs = plt.subplots(figsize=FIGURE_SIZE)
   sns.heatmap(corr,
               xticklabels=corr.columns,
               yticklabels=corr.columns,
               ax=axs)
 
-  output_path = os.path.join(
-      figure_base_path, '{}_heatmap.png'.format(heat_map_name))
-  plt.savefig(output_path, dpi=(200))
-
-  return output_path
+  return _save_figure(fig, '{}_heatmap.png'.format(heat_map_name),
+                      figure_base_path)